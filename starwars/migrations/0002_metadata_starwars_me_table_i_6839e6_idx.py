@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-14 14:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('starwars', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='metadata',
+            index=models.Index(fields=['table_info_type', '-date'], name='starwars_me_table_i_6839e6_idx'),
+        ),
+    ]
@@ -7,3 +7,5 @@ class Metadata(models.Model):
     etag = models.CharField(max_length=255, default = '')
     table_info_type = models.CharField(max_length=255, default = '')
 
+    class Meta:
+        indexes = [models.Index(fields=["table_info_type", "-date"])]
@@ -1,3 +1,83 @@
-from django.test import TestCase
+import csv
+import itertools
+import os
+import tempfile
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from starwars.models import Metadata
+from starwars.utils.starwars_api_helper import StarwarsEtl, StarWarsLookup
+
+
+class RowIndexTests(SimpleTestCase):
+    header = ["name", "comment"]
+    rows = [
+        ("Luke Skywalker", "plain"),
+        ("Padmé Amidala", "line one\nline two"),
+        ("Han Solo", 'says "hi"\r\nand "bye"'),
+        ("Leia Organa", ""),
+        ("R2-D2", "\n"),
+        ("C-3PO", '""'),
+        ("Chewbacca", "Rrraaahhh,\nhhhnnn"),
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "people.csv")
+        with StarwarsEtl(
+            API_URL="",
+            CSV_FILE_NAME="people.csv",
+            CSV_FILE_PATH=self.file_path,
+            Metadata=Metadata,
+            people_query="people",
+            planets_query="planets",
+        ) as starwars_etl:
+            message = starwars_etl.save_data_to_csv(
+                rows=self.rows,
+                header=self.header,
+                file_name="people.csv",
+                file_path=self.file_path,
+                table_info_type="people",
+                etag="",
+            )
+        self.assertIn("saved successfully", message)
+        self.assertTrue(os.path.exists(f"{self.file_path}.idx"))
+        self.lookup = StarWarsLookup()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read_window(self, start, end):
+        with open(self.file_path, newline="", encoding="utf-8") as csv_file:
+            reader = csv.reader(csv_file)
+            next(reader)
+            return list(itertools.islice(reader, start, end))
+
+    def test_every_window_matches_csv_reader(self):
+        for start in range(len(self.rows) + 1):
+            for end in range(start, len(self.rows) + 2):
+                with self.subTest(start=start, end=end):
+                    table = self.lookup.get_table_detailed_view(
+                        file_path=self.file_path,
+                        start=start,
+                        end=end,
+                        columns=self.header,
+                    )
+                    self.assertEqual(table["rows"], self.read_window(start, end))
+
+    def test_every_row_is_indexed(self):
+        for row in range(len(self.rows)):
+            with self.subTest(row=row):
+                self.assertIsNotNone(
+                    self.lookup._get_row_offset(file_path=self.file_path, row=row)
+                )
+
+    def test_out_of_range_offset_returns_no_rows(self):
+        self.assertEqual(
+            self.lookup._get_row_offset(file_path=self.file_path, row=100),
+            os.path.getsize(self.file_path),
+        )
+        table = self.lookup.get_table_detailed_view(
+            file_path=self.file_path, start=100, end=110, columns=self.header
+        )
+        self.assertEqual(table["rows"], [])
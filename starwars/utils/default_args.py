@@ -2,8 +2,25 @@
 class DefaultArgs:
 
     API_URL = 'https://swapi.dev/api'
+    API_BACKOFF_FACTOR = 0.3
+    API_MAX_RETRIES = 3
+    API_POOL_SIZE = 10
     CSV_FILE_NAME_PREFIX = f"starwars_data_"
     DEFAULT_FILE_DIR = "starwars/downloaded_data/"
+    DISPLAY_COLUMNS = ["name", "height", "mass", "homeworld", "date"]
+    PEOPLE_COLUMNS = [
+        "name",
+        "height",
+        "mass",
+        "hair_color",
+        "skin_color",
+        "eye_color",
+        "birth_year",
+        "date",
+        "homeworld",
+    ]
     PEOPLE_QUERY = "people"
     PLANETS_QUERY = "planets"
+    PLANETS_FILE_NAME = "planets_info.csv"
+    ROW_INDEX_SUFFIX = ".idx"
 
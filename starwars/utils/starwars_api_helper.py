@@ -1,13 +1,79 @@
-import datetime
-from typing import Dict
-
+import asyncio
+import csv
+import functools
+import itertools
+import logging
+import math
+import operator
+import os
+import pickle
+import re
+from array import array
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+import aiohttp
+import ijson
+import orjson
+import pandas as pd
 import petl as etl
-import requests
 
 from starwars.utils.default_args import DefaultArgs
 
+logger = logging.getLogger(__name__)
+
+
+def _planets_lookup_path(file_path: str) -> str:
+    return os.path.splitext(file_path)[0] + ".pkl"
+
+
+@functools.lru_cache(maxsize=1)
+def _read_planets_lookup(etag: str, file_path: str) -> Dict[str, str]:
+    """Read the planets url -> name lookup once per ETag.
+
+    The pickled lookup written next to the planets CSV is preferred; the CSV is
+    only parsed when the pickle is missing.
+
+    Args:
+        etag (str): The ETag of the planets data, used only as part of the cache key.
+        file_path (str): The path to the planets CSV file.
+
+    Returns:
+        dict: A dictionary mapping planet URLs to planet names.
+    """
+    try:
+        with open(_planets_lookup_path(file_path), "rb") as lookup_file:
+            return pickle.load(lookup_file)
+    except FileNotFoundError:
+        with open(file_path, newline="", encoding="utf-8") as csv_file:
+            return {
+                row["url"]: row["homeworld_name"] for row in csv.DictReader(csv_file)
+            }
+
+
+@functools.lru_cache(maxsize=128)
+def _read_header(file_path: str) -> tuple:
+    """Read the header row of a CSV file once per path.
+
+    Downloaded CSV files are never rewritten with different columns, so the
+    header of a path does not change.
+
+    Args:
+        file_path (str): The path to the CSV file.
+
+    Returns:
+        tuple: The column names of the CSV file.
+    """
+    with open(file_path, newline="", encoding="utf-8") as csv_file:
+        return tuple(next(csv.reader(csv_file)))
+
+
+def _row_index_path(file_path: str) -> str:
+    return file_path + DefaultArgs.ROW_INDEX_SUFFIX
+
 
 class StarwarsEtl:
+    EDITED_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z")
+
     def __init__(
         self,
         API_URL: str,
@@ -24,160 +90,285 @@ class StarwarsEtl:
         self.current_etag = ""
         self.people_query = people_query
         self.planets_query = planets_query
+        self.new_metadata = list()
+        self.loop = asyncio.new_event_loop()
+        self.session = None
+
+    def __enter__(self) -> "StarwarsEtl":
+        return self
 
-    def get_latest_etags(self, query: str) -> str:
-        """Get the latest ETag value for the given query.
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP session and the event loop it runs on."""
+        if self.session is not None:
+            self.loop.run_until_complete(self.session.close())
+            self.session = None
+        self.loop.close()
+
+    def get_latest_metadata(self, query: str):
+        """Get the latest metadata row for the given query.
 
         Args:
-            query (str): The type of table for which to retrieve the latest ETag.
+            query (str): The type of table for which to retrieve the latest metadata.
 
         Returns:
-            str: The latest ETag value for the given query, or an empty string if no
-                 metadata for the query is found.
+            Metadata: The latest metadata row for the given query, or None if no
+                      metadata for the query is found.
         """
 
         try:
             meta = self.Metadata.objects.filter(table_info_type=query).latest("date")
-            print(meta.etag)
+            logger.debug("Latest %s ETag: %s", query, meta.etag)
         except self.Metadata.DoesNotExist:
             meta = None
-        return meta.etag if meta else ""
+        return meta
+
+    async def _request(
+        self, method: str, url: str, headers: Optional[dict] = None
+    ) -> aiohttp.ClientResponse:
+        """Send a request over the shared keep-alive session.
 
-    def check_for_updates(self, query: str, latest_etag: str) -> bool:
-        """Check if there are updates to the data for the given query.
+        The session is created on first use with a pool of
+        ``DefaultArgs.API_POOL_SIZE`` connections. Connection errors and timeouts
+        are retried ``DefaultArgs.API_MAX_RETRIES`` times with exponential backoff.
 
         Args:
-            query (str): The query to check for updates.
-            latest_etag (str): The latest ETag value for the query.
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            headers (dict): Optional request headers.
 
         Returns:
-            bool: True if there are updates, False otherwise.
+            aiohttp.ClientResponse: The response, to be used as an async context manager.
+        """
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=DefaultArgs.API_POOL_SIZE)
+            )
+
+        for attempt in range(DefaultArgs.API_MAX_RETRIES):
+            try:
+                return await self.session.request(method, url, headers=headers)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                await asyncio.sleep(DefaultArgs.API_BACKOFF_FACTOR * 2**attempt)
+        return await self.session.request(method, url, headers=headers)
+
+    def _raise_for_status(
+        self, response: aiohttp.ClientResponse, expected: tuple = (200,)
+    ) -> None:
+        """Raise if the response status is not one of the expected ones.
+
+        Args:
+            response (aiohttp.ClientResponse): The response to check.
+            expected (tuple): The accepted status codes.
 
         Raises:
-            Exception: If the API returns a non-200 status code.
+            aiohttp.ClientResponseError: If the status is not expected. The error
+                carries the status and the requested URL.
         """
-        url = f"{self.API_URL}/{query}"
+        if response.status not in expected:
+            raise aiohttp.ClientResponseError(
+                response.request_info,
+                response.history,
+                status=response.status,
+                message=f"Unexpected status {response.status} for {response.url}",
+                headers=response.headers,
+            )
 
-        headers = {"If-None-Match": latest_etag}
-        response = requests.get(url, headers=headers)
+    async def _fetch_page(self, url: str) -> list:
+        """Fetch the results of one page, parsing them as the body streams in.
 
-        if response.status_code == 304:
-            print("Data has not changed since last request.")
-            return False
-        elif response.status_code != 200:
-            raise
-        else:
-            return True
+        Args:
+            url (str): The URL of the page.
 
-    def get_current_etag(self, url: str) -> str:
-        """Get the current ETag value for the given URL.
+        Returns:
+            list: The records of the page.
+
+        Raises:
+            aiohttp.ClientResponseError: If the API does not return a 200 status.
+            ValueError: If the page holds no records.
+        """
+        async with await self._request("GET", url) as response:
+            self._raise_for_status(response)
+            results = [
+                record
+                async for record in ijson.items_async(
+                    response.content, "results.item", use_float=True
+                )
+            ]
+
+        if not results:
+            raise ValueError(f"{url} returned no results")
+        return results
+
+    async def _fetch_all(
+        self, url: str, latest_etag: str, on_results: Callable[[list], None]
+    ) -> Dict[str, object]:
+        """Fetch every page of the given URL concurrently over the shared session.
+
+        Page 1 is requested once with ``If-None-Match`` so the same response tells
+        whether the data changed, carries the new ETag and holds the total
+        ``count``; its length gives the page size. The remaining pages are then
+        requested at once, and the results of each page are handed to
+        ``on_results`` as soon as it arrives, in page order. The last page is only
+        handed over once the number of records matches ``count``.
 
         Args:
-            url (str): The URL to get the ETag for.
+            url (str): The URL of the first page.
+            latest_etag (str): The latest ETag value stored for the query.
+            on_results (Callable): Called with the list of records of each page.
 
         Returns:
-            str: The current ETag value for the URL.
+            dict: A dictionary with keys 'etag' and 'updated'. 'updated' is False if
+                  nothing has changed since the last request.
+
+        Raises:
+            aiohttp.ClientResponseError: If the API returns a status code other than
+                200 or 304 for page 1, or other than 200 for any other page.
+            ValueError: If a page holds no records, or the pages do not add up to
+                ``count``.
         """
-        response = requests.get(url)
-        return response.headers.get("ETag")
+        headers = {"If-None-Match": latest_etag}
+        async with await self._request("GET", url, headers=headers) as response:
+            self._raise_for_status(response, expected=(200, 304))
+            if response.status == 304:
+                logger.debug("%s has not changed since last request.", url)
+                return {"etag": latest_etag, "updated": False}
+            current_etag = response.headers.get("ETag")
+            json_data = orjson.loads(await response.read())
+
+        if current_etag is None:
+            async with await self._request("HEAD", url) as response:
+                current_etag = response.headers.get("ETag", "")
+
+        count = json_data["count"]
+        page_size = len(json_data["results"])
+        if json_data["next"] is None:
+            pages = 1
+        elif page_size == 0:
+            raise ValueError(f"{url} returned no results")
+        else:
+            pages = math.ceil(count / page_size)
 
-    def get_latest_data(self, query: str) -> Dict[str, etl.Table]:
+        tasks = [
+            asyncio.ensure_future(self._fetch_page(url=f"{url}?page={page}"))
+            for page in range(2, pages + 1)
+        ]
+        try:
+            results = json_data["results"]
+            fetched = len(results)
+            for task in tasks:
+                on_results(results)
+                results = await task
+                fetched += len(results)
+            if fetched != count:
+                raise ValueError(f"{url} returned {fetched} of {count} records")
+            on_results(results)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return {"etag": current_etag, "updated": True}
+
+    def get_latest_data(
+        self, query: str, latest_etag: str, on_results: Callable[[list], None]
+    ) -> Dict[str, object]:
         """Get the latest data for the given query from the API.
 
         Args:
             query (str): The query to get the latest data for.
+            latest_etag (str): The latest ETag value stored for the query.
+            on_results (Callable): Called with the list of records of each page, in page order.
 
         Returns:
-            dict: A dictionary with keys 'etag' and 'table'. 'etag' is the current ETag value for the query,
-                  or an empty string if the request failed. 'table' is a petl table containing the data.
+            dict: A dictionary with keys 'etag' and 'updated'. 'etag' is the current ETag value for the query.
+                  'updated' is True if the data has changed and was passed to on_results.
         """
-        url = f"{self.API_URL}/{query}"
-
-        current_etag = self.get_current_etag(url=url)
-        data = list()
-        table = None
+        url = f"{self.API_URL}/{query}/"
 
-        if (
-            self.check_for_updates(
-                query=query, latest_etag=self.get_latest_etags(query)
-            )
-            == True
-        ):
-            while url:
-                response = requests.get(url)
-                json_data = response.json()
-                data.extend(json_data["results"])
-                url = json_data["next"]
-
-            table = etl.fromdicts(data)
-
-        return {"etag": current_etag, "table": table}
+        return self.loop.run_until_complete(
+            self._fetch_all(url=url, latest_etag=latest_etag, on_results=on_results)
+        )
 
     def convert_datetime(self, date: str) -> str:
-        dt = datetime.datetime.strptime(date, "%Y-%m-%dT%H:%M:%S.%fZ")
-        return dt.strftime("%Y-%m-%d")
+        if not self.EDITED_DATE_PATTERN.match(date):
+            raise ValueError(f"time data {date!r} does not match the SWAPI format")
+        return date[:10]
 
-    def get_planets_data(self) -> etl.Table:
+    def get_planets_data(self, latest_etag: str) -> Dict[str, str]:
         """
         Checks for the latest planets data. If new data is available, generates a new CSV file
-        and saves it. If no new data is available, reads the latest CSV file and returns it as a
-        petl table.
+        and saves it. If no new data is available, loads the lookup saved with the latest
+        CSV file, reading it only once per ETag.
+
+        Args:
+        - latest_etag: The latest ETag value stored for planets.
 
         Returns:
-        - petl.Table
+        - dict mapping planet URLs to planet names
 
         """
         query = self.planets_query
+        file_path = DefaultArgs.DEFAULT_FILE_DIR + DefaultArgs.PLANETS_FILE_NAME
+
+        planets_by_url = dict()
 
-        planets_data = self.get_latest_data(query=query)
-        if planets_data["table"]:
-            planets_table = etl.cut(planets_data["table"], "name", "url")
-            planets_table = etl.rename(planets_table, {"name": "homeworld_name"})
+        def add_planets(results: list) -> None:
+            for planet in results:
+                planets_by_url[planet["url"]] = planet["name"]
+
+        planets_data = self.get_latest_data(
+            query=query, latest_etag=latest_etag, on_results=add_planets
+        )
+        if planets_data["updated"]:
+            _read_planets_lookup.cache_clear()
+            if os.path.exists(_planets_lookup_path(file_path)):
+                os.remove(_planets_lookup_path(file_path))
             self.save_data_to_csv(
-                table=planets_table,
-                file_name="planets_info.csv",
-                file_path=f"{DefaultArgs.DEFAULT_FILE_DIR}planets_info.csv",
+                rows=planets_by_url.items(),
+                header=["url", "homeworld_name"],
+                file_name=DefaultArgs.PLANETS_FILE_NAME,
+                file_path=file_path,
                 table_info_type=query,
                 etag=planets_data["etag"],
             )
+            self._write_planets_lookup(
+                planets_by_url=planets_by_url, file_path=file_path
+            )
 
         else:
-            file_path_latest = (
-                self.Metadata.objects.filter(table_info_type=query)
-                .latest("date")
-                .file_path
+            planets_by_url = _read_planets_lookup(
+                etag=planets_data["etag"], file_path=file_path
             )
-            planets_table = etl.fromcsv(file_path_latest)
 
-        return planets_table
+        return planets_by_url
 
     def fix_planets_info_and_columns(
-        self, people_info: Dict[str, etl.Table]
-    ) -> etl.Table:
+        self, people: list, planets_latest_etag: str
+    ) -> Iterator[tuple]:
         """
-        Returns a petl table with the following fields: 'name', 'height', 'mass',
-        'hair_color', 'skin_color', 'eye_color', 'birth_year', 'date', and 'homeworld'.
-        This method fixes issues related to homeworld URL, renames columns, and converts
-        the 'date' field to a Python datetime object.
+        Returns the people rows as tuples of the following fields, in the order of
+        DefaultArgs.PEOPLE_COLUMNS: 'name', 'height', 'mass', 'hair_color', 'skin_color',
+        'eye_color', 'birth_year', 'date', and 'homeworld'.
+        This method replaces the homeworld URL with the planet name using the planets
+        lookup dict and converts the 'edited' field to the 'date' field. The planets
+        lookup is fetched before returning, so its errors are raised here.
 
         Args:
-            people_info: A dictionary containing information about the people table.
-                The dictionary must have a 'table' key containing a petl table with the
+            people: The list of people records returned by the API, with at least the
                 following fields: 'name', 'height', 'mass', 'hair_color', 'skin_color',
                 'eye_color', 'birth_year', 'edited', and 'homeworld'.
+            planets_latest_etag: The latest ETag value stored for planets.
 
         Returns:
-            A petl table containing the fields described above.
+            An iterator of tuples containing the fields described above.
 
         Raises:
-            None
+            aiohttp.ClientResponseError, ValueError: If fetching the planets fails.
         """
-        planets_table = self.get_planets_data()
-        people_table = people_info["table"].join(
-            planets_table, lkey="homeworld", rkey="url"
-        )
-
-        people_table = people_table.cut(
+        planets_by_url = self.get_planets_data(latest_etag=planets_latest_etag)
+        person_fields = operator.itemgetter(
             "name",
             "height",
             "mass",
@@ -185,28 +376,32 @@ class StarwarsEtl:
             "skin_color",
             "eye_color",
             "birth_year",
-            "edited",
-            "homeworld_name",
         )
-        people_table = etl.convert(people_table, "edited", self.convert_datetime)
 
-        return etl.rename(
-            people_table, {"edited": "date", "homeworld_name": "homeworld"}
+        return (
+            (
+                *person_fields(person),
+                self.convert_datetime(person["edited"]),
+                planets_by_url.get(person["homeworld"], ""),
+            )
+            for person in people
         )
 
     def save_data_to_csv(
         self,
-        table: etl.Table,
+        rows: Iterable[tuple],
+        header: list[str],
         file_name: str,
         file_path: str,
         table_info_type: str,
         etag: str,
     ) -> str:
         """
-        Write a petl.Table object to a CSV file at the specified path.
+        Write rows to a CSV file at the specified path with csv.writer.
 
         Args:
-            table (petl.Table): A table object containing the data to be written to the CSV file.
+            rows (Iterable[tuple]): The rows to be written to the CSV file, in header order.
+            header (List[str]): The column names of the CSV file.
             file_name: CSV file name
             file_path (str): The path to the CSV file to write to.
             table_info_type: information about table data (planets ot people)
@@ -216,7 +411,11 @@ class StarwarsEtl:
             str: message about the result
         """
         try:
-            table.tocsv(file_path)
+            with open(file_path, "w", newline="", encoding="utf-8") as csv_file:
+                writer = csv.writer(csv_file)
+                writer.writerow(header)
+                writer.writerows(rows)
+            self._write_row_index(file_path=file_path)
             self._log_new_metadata(
                 file_name=file_name,
                 file_path=file_path,
@@ -227,6 +426,53 @@ class StarwarsEtl:
         except Exception as e:
             return f"An error occurred while trying to save CSV file {e}"
 
+    def _write_row_index(self, file_path: str) -> None:
+        """Write the byte offset of every data row of a CSV file to its index file.
+
+        A newline only ends a row when it is outside a quoted field, i.e. when an
+        even number of quotes has been seen so far. CSV files are written as UTF-8,
+        where the quote byte never occurs inside a multi-byte character, and the
+        offsets are only valid for readers that open the file as UTF-8.
+
+        Args:
+            file_path (str): The path to the CSV file to index.
+
+        Returns:
+            None
+        """
+        offsets = array("q")
+        with open(file_path, "rb") as csv_file:
+            position = len(csv_file.readline())
+            quotes = 0
+            for line in csv_file:
+                if quotes % 2 == 0:
+                    offsets.append(position)
+                quotes += line.count(b'"')
+                position += len(line)
+
+        with open(_row_index_path(file_path), "wb") as index_file:
+            offsets.tofile(index_file)
+
+    def _write_planets_lookup(
+        self, planets_by_url: Dict[str, str], file_path: str
+    ) -> None:
+        """Pickle the planets url -> name lookup next to the planets CSV file.
+
+        The pickle is written to a temporary file first and moved into place, so a
+        reader never sees a partially written lookup.
+
+        Args:
+            planets_by_url (dict): A dictionary mapping planet URLs to planet names.
+            file_path (str): The path to the planets CSV file.
+
+        Returns:
+            None
+        """
+        lookup_path = _planets_lookup_path(file_path)
+        with open(f"{lookup_path}.tmp", "wb") as lookup_file:
+            pickle.dump(planets_by_url, lookup_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{lookup_path}.tmp", lookup_path)
+
     def _log_new_metadata(
         self,
         file_name: str,
@@ -236,6 +482,9 @@ class StarwarsEtl:
     ) -> None:
         """Log data files's metadata.
 
+        The row is only built here; it is inserted together with the other rows of
+        the ingestion by ``start_starwars_data_ingestion``.
+
         Parameters
         ----------
         file_name: str
@@ -251,43 +500,54 @@ class StarwarsEtl:
         -------
         None
         """
-        self.Metadata.objects.create(
-            file_name=file_name,
-            file_path=file_path,
-            table_info_type=table_info_type,
-            etag=etag,
+        self.new_metadata.append(
+            self.Metadata(
+                file_name=file_name,
+                file_path=file_path,
+                table_info_type=table_info_type,
+                etag=etag,
+            )
         )
 
-    def get_people_data(self) -> str:
+    def get_people_data(self, latest_metadata: dict) -> str:
         """Get people data from the Star Wars API and save it as a CSV file.
 
+        Args:
+            latest_metadata: The latest metadata row of each query, or None for a
+                query that has never been downloaded.
+
         Returns:
             A status message indicating whether new data was saved or not.
         """
 
         query = self.people_query
+        people_metadata = latest_metadata[query]
+        planets_metadata = latest_metadata[self.planets_query]
+
+        people = list()
+        people_info = self.get_latest_data(
+            query=query,
+            latest_etag=people_metadata.etag if people_metadata else "",
+            on_results=people.extend,
+        )
 
-        people_info = self.get_latest_data(query=query)
-
-        if people_info["table"]:
-            sw_data = self.fix_planets_info_and_columns(people_info=people_info)
-            print(sw_data)
+        if people_info["updated"]:
+            sw_data = self.fix_planets_info_and_columns(
+                people=people,
+                planets_latest_etag=planets_metadata.etag if planets_metadata else "",
+            )
             status_message = self.save_data_to_csv(
-                sw_data,
+                rows=sw_data,
+                header=DefaultArgs.PEOPLE_COLUMNS,
                 file_name=self.CSV_FILE_NAME,
                 file_path=self.CSV_FILE_PATH,
                 table_info_type=query,
                 etag=people_info["etag"],
             )
         else:
-            file_path_latest = (
-                self.Metadata.objects.filter(table_info_type=query)
-                .latest("date")
-                .file_path
-            )
             self._log_new_metadata(
                 file_name=self.CSV_FILE_NAME,
-                file_path=file_path_latest,
+                file_path=people_metadata.file_path,
                 table_info_type=query,
                 etag=people_info["etag"],
             )
@@ -296,35 +556,101 @@ class StarwarsEtl:
         return status_message
 
     def start_starwars_data_ingestion(self):
-        status_message = self.get_people_data()
+        latest_metadata = {
+            query: self.get_latest_metadata(query)
+            for query in (self.people_query, self.planets_query)
+        }
+        status_message = self.get_people_data(latest_metadata=latest_metadata)
+        self.Metadata.objects.bulk_create(self.new_metadata)
         return status_message
 
 
 class StarWarsLookup:
-    def get_table_detailed_view(self, file_path: str) -> etl.Table:
-        table = etl.fromcsv(file_path)
-        return table
+    def get_header(self, file_path: str) -> list[str]:
+        """
+        Returns the header row of the given CSV file, reading it only once per file.
 
-    def get_calcualted_table(self, file_path: str, columns: list[str]) -> etl.Table:
+        Args:
+            file_path (str): The file path for the CSV file to read.
+
+        Returns:
+            List[str]: The column names of the CSV file.
+        """
+        return list(_read_header(file_path))
+
+    def get_table_detailed_view(
+        self, file_path: str, start: int, end: int, columns: list[str]
+    ) -> Dict[str, list]:
         """
-        Calculates the count of values for each column in the selected_columns list for the given CSV file.
+        Reads the selected columns of the rows in the [start, end) window of the given CSV file.
+        When the CSV has an index file, seeks straight to the first row of the window.
 
         Args:
             file_path (str): The file path for the CSV file to read.
-            selected_columns (List[str]): The list of column names for which to calculate the value counts.
+            start (int): Index of the first data row to return.
+            end (int): Index of the data row to stop at.
+            columns (List[str]): The column names to return; names missing from the CSV are ignored.
 
         Returns:
-            etl.Table: A table containing the value counts for each concatenated column in the selected_columns list.
+            dict: A dictionary with keys 'columns' (the returned column names) and 'rows'
+                  (the list of rows in the requested window).
         """
+        header = _read_header(file_path)
+        with open(
+            file_path, newline="", encoding="utf-8", buffering=1 << 20
+        ) as csv_file:
+            reader = csv.reader(csv_file)
+            row_offset = self._get_row_offset(file_path=file_path, row=start)
+            if row_offset is None:
+                next(reader)
+                rows = itertools.islice(reader, start, end)
+            else:
+                csv_file.seek(row_offset)
+                rows = itertools.islice(reader, end - start)
+
+            columns = [column for column in columns if column in header]
+            indexes = [header.index(column) for column in columns]
+            rows = [[row[index] for index in indexes] for row in rows]
+
+        return {"columns": columns, "rows": rows}
+
+    def _get_row_offset(self, file_path: str, row: int) -> Optional[int]:
+        """
+        Looks up the byte offset of a data row in the index file written next to the CSV.
 
-        table = etl.fromcsv(file_path)
+        Args:
+            file_path (str): The file path for the CSV file.
+            row (int): Index of the data row.
 
-        table = etl.addfield(
-            etl.cut(table, columns), "concatenated", lambda row: " ".join(row)
-        )
+        Returns:
+            int: The byte offset of the row, the size of the CSV file if the row is past
+                 its end, or None if the CSV has no usable index file.
+        """
+        offsets = array("q")
+        try:
+            with open(_row_index_path(file_path), "rb") as index_file:
+                index_file.seek(row * offsets.itemsize)
+                offsets.frombytes(index_file.read(offsets.itemsize))
+        except (FileNotFoundError, ValueError):
+            return None
+        return offsets[0] if offsets else os.path.getsize(file_path)
 
-        concate = etl.aggregate(table, "concatenated", len)
-        final_table = table.join(concate, lkey="concatenated", rkey="concatenated")
-        final_table = etl.cutout(final_table, "concatenated")
-        final_table = etl.distinct(etl.rename(final_table, {"value": "count"}))
-        return final_table
+    def get_calcualted_table(self, file_path: str, columns: list[str]) -> etl.Table:
+        """
+        Calculates the count of values for each column in the columns list for the given CSV file.
+        The grouping yields each combination once, so no distinct pass is needed.
+
+        Args:
+            file_path (str): The file path for the CSV file to read.
+            columns (List[str]): The list of column names for which to calculate the value counts.
+
+        Returns:
+            etl.Table: A table with one row per distinct combination of the selected columns and its count.
+        """
+
+        columns = list(dict.fromkeys(columns))
+        table = pd.read_csv(
+            file_path, usecols=columns, dtype=str, keep_default_na=False
+        )
+        counts = table.groupby(columns, sort=False).size().reset_index(name="count")
+        return etl.fromdataframe(counts)
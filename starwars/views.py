@@ -37,15 +37,15 @@ class DownloadDataView(View):
         if 'download_data' in request.GET and request.GET['download_data'] == 'true':
             # If the 'download_data' parameter is set to 'true', download data from the Star Wars API and save it to a CSV file
             CSV_FILE_NAME = DefaultArgs.CSV_FILE_NAME_PREFIX+f"{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}.csv"
-            ETL = StarwarsEtl(
+            with StarwarsEtl(
                 API_URL=DefaultArgs.API_URL,
                 CSV_FILE_NAME=CSV_FILE_NAME,
                 CSV_FILE_PATH=DefaultArgs.DEFAULT_FILE_DIR+CSV_FILE_NAME,
                 Metadata=Metadata,
                 people_query = DefaultArgs.PEOPLE_QUERY,
                 planets_query = DefaultArgs.PLANETS_QUERY,
-            )
-            message = ETL.start_starwars_data_ingestion()
+            ) as ETL:
+                message = ETL.start_starwars_data_ingestion()
             # If the download is successful, add a success message to the user's messages
             messages.success(request, message)
 
@@ -62,7 +62,8 @@ class DatasetDetailView(DetailView):
 
     This view uses the Django `DetailView` class to display detailed information about a previously downloaded dataset,
     including the dataset's file path and a table of data from the CSV file. The view transforms the raw CSV data
-    into a format that can be displayed in an HTML table, and supports pagination using an offset parameter.
+    into a format that can be displayed in an HTML table, and supports pagination using an offset parameter and
+    choosing the displayed columns using `fields` parameters.
     """
 
     model = Metadata
@@ -84,9 +85,7 @@ class DatasetDetailView(DetailView):
         # Retrieve information about the dataset from the metadata table
         dataset = self.get_object()
 
-        # Load the CSV file and transform it for display
         data_lookup = StarWarsLookup()
-        table = data_lookup.get_table_detailed_view(file_path=dataset.file_path)
 
         # Get the offset from the request parameters and calculate the start and end indices
         offset = int(self.request.GET.get("offset", "0"))
@@ -94,27 +93,33 @@ class DatasetDetailView(DetailView):
         start = max(offset, 0)
         end = start + batch_size
 
-        # Get the specified rows based on the offset and batch size
-        rows = table[0:end]
+        header = data_lookup.get_header(file_path=dataset.file_path)
 
-        # Pass the transformed data, the offset, and the batch size to the template for display
-        context["table"] = rows
+        # Read only the valid requested fields of the batch, or the default display columns
+        fields = [
+            field for field in self.request.GET.getlist("fields") if field in header
+        ] or DefaultArgs.DISPLAY_COLUMNS
+        table = data_lookup.get_table_detailed_view(
+            file_path=dataset.file_path, start=start, end=end, columns=fields
+        )
+
+        # Pass the rows, the next offset and the columns to the template for display
+        context["table"] = table["rows"]
         context["offset"] = end
-        context["columns"] = etl.header(rows)
+        context["columns"] = table["columns"]
         context["is_main"] = True
 
-        columns_basic = self.request.GET.get('columns', '')
-        print("thisi is basic", columns_basic)
-        # Split the values by '&?columns='
-        columns = columns_basic.split('&?columns=')
-        # Print the values
-        print(columns)
-        
-        if len(columns) > 0 and columns[0] != "":
-            context["table"] = data_lookup.get_calcualted_table(file_path=dataset.file_path, columns=columns)[0:]
-            context["columns"] = etl.header( context["table"])
+        # Keep only the selected columns that exist in the dataset
+        columns = [
+            column
+            for column in dict.fromkeys(self.request.GET.getlist("columns"))
+            if column in header
+        ]
+
+        if columns:
+            context["table"] = etl.data(data_lookup.get_calcualted_table(file_path=dataset.file_path, columns=columns))
+            context["columns"] = columns + ["count"]
             context["is_main"] = False
-            print(context["table"])
 
         return context
 